@@ -0,0 +1,18 @@
+"""Shared HTTP session for the site scrapers and notifier"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = 'Mozilla/5.0 (compatible; KI-Job-Scraper/1.0)'
+
+# One session keeps keep-alive connections open across requests to the same
+# host (e.g. the per-job detail pages on varbi.com), instead of a new
+# TCP + TLS handshake for every call.
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+))
@@ -3,33 +3,85 @@
 import logging
 import requests
 import unicodedata
-from typing import Dict, List
+from typing import Dict, List, Tuple
+
+from scraper.http import SESSION
 
 logger = logging.getLogger(__name__)
 
 NTFY_TOPIC = "andrada-ki-jobs"
 NTFY_URL = f"https://ntfy.sh/{NTFY_TOPIC}"
 
+# Keywords listed under "High priority" in the notification body
+HIGH_PRIORITY_SET = frozenset({
+    'organoid', 'ipsc', 'induced pluripotent', 'stem cell',
+    'neuroscience', 'neurodevelopmental', 'neural stem',
+    'brain organoid', 'single-cell', 'scrna-seq', 'spatial transcriptomics'
+})
+
+# Keywords that raise the push notification priority
+URGENT_SET = frozenset({'organoid', 'ipsc', 'neuroscience'})
+
+SOURCE_NAMES = {
+    'ki_doktorand': 'KI Doctoral',
+    'ki_varbi': 'KI Staff',
+    'academic_positions': 'Academic Positions'
+}
+
+# ntfy.sh delivers longer message bodies as an attachment instead of text
+MAX_MESSAGE_BYTES = 4096
+BATCH_SEPARATOR = "\n\n"
+
+# Punctuation that NFKD leaves non-ASCII, mapped for header-safe titles
+HEADER_REPLACEMENTS = str.maketrans({
+    '\u2013': '-',  # en-dash
+    '\u2014': '-',  # em-dash
+    '\u2018': "'",  # left single quote
+    '\u2019': "'",  # right single quote
+    '\u201c': '"',  # left double quote
+    '\u201d': '"',  # right double quote
+})
+
 
 def sanitize_header(text: str) -> str:
     """Sanitize text for HTTP headers (ASCII-safe)"""
+    # Most titles are plain English, and NFKD leaves ASCII unchanged
+    if text.isascii():
+        return text
     # Normalize unicode (e.g., en-dash to hyphen)
     text = unicodedata.normalize('NFKD', text)
-    # Replace common problematic characters
-    replacements = {
-        '\u2013': '-',  # en-dash
-        '\u2014': '-',  # em-dash
-        '\u2018': "'",  # left single quote
-        '\u2019': "'",  # right single quote
-        '\u201c': '"',  # left double quote
-        '\u201d': '"',  # right double quote
-    }
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    # Replace common problematic characters in a single pass
+    text = text.translate(HEADER_REPLACEMENTS)
     # Remove any remaining non-ASCII characters
     return text.encode('ascii', 'ignore').decode('ascii')
 
 
+def format_job_lines(job: Dict, matched_keywords: List[str]) -> Tuple[List[str], bool]:
+    """Build the deadline/source/keyword lines for a job, and whether it is urgent"""
+    lines = []
+
+    if job.get('deadline'):
+        lines.append(f"Deadline: {job['deadline']}")
+
+    source = SOURCE_NAMES.get(job.get('source'), job.get('source', 'Unknown'))
+    lines.append(f"Source: {source}")
+
+    # Keywords matched, split by priority in a single pass
+    high, medium = [], []
+    is_urgent = False
+    for keyword in matched_keywords:
+        keyword_lower = keyword.lower()
+        (high if keyword_lower in HIGH_PRIORITY_SET else medium).append(keyword)
+        is_urgent = is_urgent or keyword_lower in URGENT_SET
+
+    if high:
+        lines.append(f"High priority: {', '.join(high)}")
+    if medium:
+        lines.append(f"Medium priority: {', '.join(medium)}")
+
+    return lines, is_urgent
+
+
 def send_notification(job: Dict, matched_keywords: List[str]) -> bool:
     """
     Send a push notification for a new job via ntfy.sh
@@ -49,44 +101,18 @@ def send_notification(job: Dict, matched_keywords: List[str]) -> bool:
             title += "..."
 
         # Build message body
-        lines = []
-
-        if job.get('deadline'):
-            lines.append(f"Deadline: {job['deadline']}")
-
-        # Source info
-        source_names = {
-            'ki_doktorand': 'KI Doctoral',
-            'ki_varbi': 'KI Staff',
-            'academic_positions': 'Academic Positions'
-        }
-        source = source_names.get(job.get('source'), job.get('source', 'Unknown'))
-        lines.append(f"Source: {source}")
-
-        # Keywords matched
-        if matched_keywords:
-            high_priority = ['organoid', 'ipsc', 'induced pluripotent', 'stem cell',
-                           'neuroscience', 'neurodevelopmental', 'neural stem',
-                           'brain organoid', 'single-cell', 'scrna-seq', 'spatial transcriptomics']
-            high = [k for k in matched_keywords if k.lower() in high_priority]
-            medium = [k for k in matched_keywords if k.lower() not in high_priority]
-
-            if high:
-                lines.append(f"High priority: {', '.join(high)}")
-            if medium:
-                lines.append(f"Medium priority: {', '.join(medium)}")
-
+        lines, is_urgent = format_job_lines(job, matched_keywords)
         message = "\n".join(lines)
 
         # Send via ntfy.sh
-        response = requests.post(
+        response = SESSION.post(
             NTFY_URL,
             data=message.encode('utf-8'),
             headers={
                 "Title": title,
                 "Click": job['url'],
                 "Tags": "briefcase,sweden",
-                "Priority": "high" if any(k.lower() in ['organoid', 'ipsc', 'neuroscience'] for k in matched_keywords) else "default"
+                "Priority": "high" if is_urgent else "default"
             },
             timeout=10
         )
@@ -103,10 +129,76 @@ def send_notification(job: Dict, matched_keywords: List[str]) -> bool:
         return False
 
 
+def send_notifications_batch(jobs_with_keywords: List[Tuple[Dict, List[str]]]) -> int:
+    """
+    Send new jobs as one combined push notification via ntfy.sh
+
+    A single job gets the regular per-job notification, which links
+    straight to the posting. Several jobs share one message, split only
+    when the body would exceed MAX_MESSAGE_BYTES.
+
+    Args:
+        jobs_with_keywords: (job dict, matched keywords) pairs
+
+    Returns:
+        Number of jobs covered by notifications that were sent
+    """
+    if len(jobs_with_keywords) == 1:
+        job, matched_keywords = jobs_with_keywords[0]
+        return int(send_notification(job, matched_keywords))
+
+    # Each batch is (entries, is_urgent)
+    batches = []
+    size = MAX_MESSAGE_BYTES
+    for job, matched_keywords in jobs_with_keywords:
+        lines, is_urgent = format_job_lines(job, matched_keywords)
+        entry = "\n".join([job['title'], *lines, job['url']])
+        entry_size = len(entry.encode('utf-8')) + len(BATCH_SEPARATOR)
+        if size + entry_size > MAX_MESSAGE_BYTES:
+            batches.append(([], False))
+            size = 0
+        entries, batch_urgent = batches[-1]
+        entries.append(entry)
+        batches[-1] = (entries, batch_urgent or is_urgent)
+        size += entry_size
+
+    sent = 0
+    for entries, is_urgent in batches:
+        if send_batch(entries, is_urgent):
+            sent += len(entries)
+    return sent
+
+
+def send_batch(entries: List[str], is_urgent: bool) -> bool:
+    """POST one combined notification for several job entries"""
+    try:
+        response = SESSION.post(
+            NTFY_URL,
+            data=BATCH_SEPARATOR.join(entries).encode('utf-8'),
+            headers={
+                "Title": f"KI Jobs - {len(entries)} New Position(s)",
+                "Tags": "briefcase,sweden",
+                "Priority": "high" if is_urgent else "default"
+            },
+            timeout=10
+        )
+        response.raise_for_status()
+
+        logger.info(f"Notification sent for {len(entries)} jobs")
+        return True
+
+    except requests.RequestException as e:
+        logger.error(f"Failed to send notification: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Error sending notification: {e}")
+        return False
+
+
 def send_test_notification() -> bool:
     """Send a test notification to verify ntfy.sh is working"""
     try:
-        response = requests.post(
+        response = SESSION.post(
             NTFY_URL,
             data="This is a test notification from your KI Job Scraper.\n\nIf you see this, notifications are working!",
             headers={
@@ -136,7 +228,7 @@ def send_summary_notification(new_count: int, total_matching: int) -> bool:
             title = f"KI Jobs - {new_count} New Position(s)!"
             priority = "default"
 
-        response = requests.post(
+        response = SESSION.post(
             NTFY_URL,
             data=message.encode('utf-8'),
             headers={
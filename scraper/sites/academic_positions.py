@@ -1,5 +1,7 @@
 """Scraper for Academic Positions - KI PhD listings"""
 
+import functools
+import hashlib
 import logging
 import requests
 from bs4 import BeautifulSoup
@@ -7,10 +9,35 @@ from typing import List, Dict, Optional
 from datetime import datetime
 import re
 
+from scraper.http import SESSION
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://academicpositions.com/jobs/employer/karolinska-institutet/position/phd"
 
+JOB_LINK_RE = re.compile(r'/jobs/\d+')
+JOB_CARD_LINK_RE = re.compile(r'/jobs?/')
+JOB_NUMERIC_ID_RE = re.compile(r'/jobs?/(\d+)')
+JOB_SLUG_ID_RE = re.compile(r'/jobs?/([a-z0-9-]+)')
+
+ISO_FORMATS = ('%Y-%m-%d',)
+NUMERIC_FORMATS = ('%d/%m/%Y', '%m/%d/%Y')
+MONTH_NAME_FORMATS = ('%B %d, %Y', '%B %d %Y', '%b %d, %Y')
+
+# Tried in order; each pattern carries the strptime formats its match can take
+DEADLINE_PATTERNS = [(re.compile(p), formats) for p, formats in (
+    (r'[Dd]eadline[:\s]+(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+    (r'[Dd]eadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})', NUMERIC_FORMATS),
+    (r'[Aa]pply by[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})', MONTH_NAME_FORMATS),
+    (r'[Aa]pplication deadline[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})', MONTH_NAME_FORMATS),
+    (r'[Cc]losing[:\s]+(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+    (r'[Ee]xpires?[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})', MONTH_NAME_FORMATS),
+)]
+
+# Each pattern needs one of these (minus its either-case first letter),
+# so text without any of them cannot contain a deadline
+DEADLINE_MARKERS = ('eadline', 'pply by', 'losing', 'xpire')
+
 
 def scrape() -> List[Dict]:
     """
@@ -27,15 +54,16 @@ def scrape() -> List[Dict]:
     - description: brief description if available
     """
     jobs = []
+    parse_deadline_text.cache_clear()
 
     try:
         logger.info(f"Fetching {BASE_URL}")
-        response = requests.get(BASE_URL, timeout=30, headers={
+        response = SESSION.get(BASE_URL, timeout=30, headers={
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'lxml')
+        soup = BeautifulSoup(response.content, 'lxml')
 
         # Academic Positions uses job cards/listings
         # Look for job listing containers
@@ -43,9 +71,10 @@ def scrape() -> List[Dict]:
 
         if not job_cards:
             # Try finding links to job pages
-            job_links = soup.find_all('a', href=re.compile(r'/jobs/\d+'))
+            job_links = soup.find_all('a', href=JOB_LINK_RE)
 
             seen_ids = set()
+            deadline_cache = {}
             for link in job_links:
                 href = link.get('href', '')
                 job_id = extract_job_id(href)
@@ -65,7 +94,7 @@ def scrape() -> List[Dict]:
                 else:
                     url = href
 
-                deadline, deadline_date = find_deadline(link)
+                deadline, deadline_date = find_deadline(link, deadline_cache)
 
                 jobs.append({
                     'id': f"academic_positions_{job_id}",
@@ -84,12 +113,10 @@ def scrape() -> List[Dict]:
                     jobs.append(job_data)
 
         # Deduplicate
-        seen_ids = set()
-        unique_jobs = []
+        by_id = {}
         for job in jobs:
-            if job['id'] not in seen_ids:
-                seen_ids.add(job['id'])
-                unique_jobs.append(job)
+            by_id.setdefault(job['id'], job)
+        unique_jobs = list(by_id.values())
 
         logger.info(f"Found {len(unique_jobs)} positions on Academic Positions")
         return unique_jobs
@@ -105,20 +132,26 @@ def scrape() -> List[Dict]:
 def extract_job_id(href: str) -> Optional[str]:
     """Extract job ID from URL"""
     # Pattern: /jobs/123456 or /job/123456
-    match = re.search(r'/jobs?/(\d+)', href)
+    match = JOB_NUMERIC_ID_RE.search(href)
     if match:
         return match.group(1)
 
     # Try slug-based ID
-    match = re.search(r'/jobs?/([a-z0-9-]+)', href)
+    match = JOB_SLUG_ID_RE.search(href)
     if match:
         return match.group(1)
 
     return None
 
 
-def find_deadline(element) -> tuple:
-    """Try to find deadline date near an element"""
+def find_deadline(element, cache: Optional[Dict] = None) -> tuple:
+    """Try to find deadline date near an element
+
+    `cache` maps ancestor ids to their parsed deadline; share one dict
+    across a page's links so common ancestors are only parsed once.
+    """
+    if cache is None:
+        cache = {}
     deadline = None
     deadline_date = None
 
@@ -126,8 +159,10 @@ def find_deadline(element) -> tuple:
     for _ in range(5):
         if parent is None:
             break
-        text = parent.get_text()
-        deadline, deadline_date = parse_deadline_text(text)
+        key = id(parent)
+        if key not in cache:
+            cache[key] = parse_deadline_text(parent.get_text())
+        deadline, deadline_date = cache[key]
         if deadline:
             break
         parent = parent.parent
@@ -135,30 +170,21 @@ def find_deadline(element) -> tuple:
     return deadline, deadline_date
 
 
+@functools.lru_cache(maxsize=2048)
 def parse_deadline_text(text: str) -> tuple:
     """Parse deadline from text"""
-    patterns = [
-        r'[Dd]eadline[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'[Dd]eadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
-        r'[Aa]pply by[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})',
-        r'[Aa]pplication deadline[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})',
-        r'[Cc]losing[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'[Ee]xpires?[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    if not any(marker in text for marker in DEADLINE_MARKERS):
+        return None, None
+
+    for pattern, formats in DEADLINE_PATTERNS:
+        match = pattern.search(text)
         if match:
             date_str = match.group(1)
-            try:
-                for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%B %d, %Y', '%B %d %Y', '%b %d, %Y']:
-                    try:
-                        deadline_date = datetime.strptime(date_str, fmt)
-                        return date_str, deadline_date
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
+            for fmt in formats:
+                try:
+                    return date_str, datetime.strptime(date_str, fmt)
+                except ValueError:
+                    continue
             return date_str, None
 
     return None, None
@@ -167,7 +193,7 @@ def parse_deadline_text(text: str) -> tuple:
 def parse_job_card(card) -> Optional[Dict]:
     """Parse a job card element"""
     # Find the main link
-    link = card.find('a', href=re.compile(r'/jobs?/'))
+    link = card.find('a', href=JOB_CARD_LINK_RE)
     if not link:
         link = card.find('a', href=True)
 
@@ -179,7 +205,6 @@ def parse_job_card(card) -> Optional[Dict]:
 
     if not job_id:
         # Generate ID from href hash
-        import hashlib
         job_id = hashlib.md5(href.encode()).hexdigest()[:10]
 
     # Get title
@@ -3,14 +3,49 @@
 import logging
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from datetime import datetime
 import re
 
+from scraper.http import SESSION
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://kidoktorand.varbi.com/en/"
 
+# Varbi job URLs look like /what:job/jobID:12345/
+JOB_ID_RE = re.compile(r'jobID[=:](\d+)')
+JOB_HREF_RE = re.compile(r'/what:job/jobID:\d+')
+JOB_HREF_FALLBACK_RE = re.compile(r'jobID[=:]\d+')
+
+LAST_APPLICATION_RE = re.compile(
+    r'Last application date[\s:]*(\d{1,2}[\./-][A-Za-z]{3}[\./-]\d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
+    re.IGNORECASE
+)
+DETAIL_DATE_FORMATS = ('%d.%b.%Y', '%d-%b-%Y', '%Y-%m-%d', '%d/%m/%Y', '%d.%m.%Y')
+
+DESCRIPTION_LENGTH = 3000
+WORD_RE = re.compile(r'\S+')
+
+ISO_FORMATS = ('%Y-%m-%d',)
+NUMERIC_FORMATS = ('%d/%m/%Y', '%m/%d/%Y')
+MONTH_NAME_FORMATS = ('%B %d, %Y', '%B %d %Y')
+
+# Common patterns: "Deadline: 2024-03-15", "Apply by March 15, 2024".
+# Tried in order; each pattern carries the strptime formats its match can take
+DEADLINE_PATTERNS = [(re.compile(p), formats) for p, formats in (
+    (r'[Dd]eadline[:\s]+(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+    (r'[Dd]eadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})', NUMERIC_FORMATS),
+    (r'[Aa]pply by[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})', MONTH_NAME_FORMATS),
+    (r'[Ll]ast application date[:\s]+(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+    (r'(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+)]
+
+# Labels the patterns above look for, without their first letter since
+# that may be either case. With none present only the ISO fallback can hit
+DEADLINE_MARKERS = ('eadline', 'pply by', 'ast application date')
+
 
 def scrape() -> List[Dict]:
     """
@@ -30,12 +65,10 @@ def scrape() -> List[Dict]:
 
     try:
         logger.info(f"Fetching {BASE_URL}")
-        response = requests.get(BASE_URL, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; KI-Job-Scraper/1.0)'
-        })
+        response = SESSION.get(BASE_URL, timeout=30)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'lxml')
+        soup = BeautifulSoup(response.content, 'lxml')
 
         # Varbi sites typically list jobs in a container with job cards
         # Look for common patterns in Varbi job listings
@@ -44,10 +77,10 @@ def scrape() -> List[Dict]:
         # If no structured elements found, try to find links to job postings
         if not job_listings:
             # Varbi URLs typically have format /what:job/jobID:XXXXX/
-            job_links = soup.find_all('a', href=re.compile(r'/what:job/jobID:\d+'))
+            job_links = soup.find_all('a', href=JOB_HREF_RE)
             if not job_links:
                 # Try alternative patterns
-                job_links = soup.find_all('a', href=re.compile(r'jobID[=:]\d+'))
+                job_links = soup.find_all('a', href=JOB_HREF_FALLBACK_RE)
 
             for link in job_links:
                 job_id = extract_job_id(link.get('href', ''))
@@ -84,22 +117,22 @@ def scrape() -> List[Dict]:
                     jobs.append(job_data)
 
         # Deduplicate by ID
-        seen_ids = set()
-        unique_jobs = []
+        by_id = {}
         for job in jobs:
-            if job['id'] not in seen_ids:
-                seen_ids.add(job['id'])
-                unique_jobs.append(job)
+            by_id.setdefault(job['id'], job)
+        unique_jobs = list(by_id.values())
 
         # Fetch details (deadline + description) from detail pages
+        # Pages are fetched concurrently over the shared session's connection pool
         logger.info(f"Found {len(unique_jobs)} doctoral positions, fetching details...")
-        for job in unique_jobs:
-            details = fetch_job_details(job['url'])
-            if details['deadline']:
-                job['deadline'] = details['deadline']
-                job['deadline_date'] = details['deadline_date']
-            if details['description']:
-                job['description'] = details['description']
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_details = executor.map(fetch_job_details, [job['url'] for job in unique_jobs])
+            for job, details in zip(unique_jobs, all_details):
+                if details['deadline']:
+                    job['deadline'] = details['deadline']
+                    job['deadline_date'] = details['deadline_date']
+                if details['description']:
+                    job['description'] = details['description']
 
         return unique_jobs
 
@@ -114,7 +147,7 @@ def scrape() -> List[Dict]:
 def extract_job_id(href: str) -> Optional[str]:
     """Extract job ID from Varbi URL"""
     # Pattern: jobID:12345 or jobID=12345
-    match = re.search(r'jobID[=:](\d+)', href)
+    match = JOB_ID_RE.search(href)
     if match:
         return match.group(1)
     return None
@@ -124,27 +157,28 @@ def fetch_job_details(url: str) -> Dict:
     """Fetch job detail page to get deadline and description for keyword matching"""
     result = {'deadline': None, 'deadline_date': None, 'description': ''}
     try:
-        response = requests.get(url, timeout=15, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; KI-Job-Scraper/1.0)'
-        })
+        response = SESSION.get(url, timeout=15)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'lxml')
+        soup = BeautifulSoup(response.content, 'lxml')
         text = soup.get_text()
 
-        # Get description (first 3000 chars of main content for keyword matching)
-        result['description'] = ' '.join(text.split())[:3000]
+        # Get description (first 3000 chars of main content for keyword matching),
+        # collecting words only until there are enough of them
+        words, length = [], -1
+        for word in WORD_RE.finditer(text):
+            words.append(word.group())
+            length += len(words[-1]) + 1
+            if length >= DESCRIPTION_LENGTH:
+                break
+        result['description'] = ' '.join(words)[:DESCRIPTION_LENGTH]
 
         # Search for date after "Last application date" (with possible whitespace/newlines)
-        match = re.search(
-            r'Last application date[\s:]*(\d{1,2}[\./-][A-Za-z]{3}[\./-]\d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}[\./-]\d{1,2}[\./-]\d{4})',
-            text,
-            re.IGNORECASE
-        )
+        match = LAST_APPLICATION_RE.search(text)
         if match:
             date_str = match.group(1)
             result['deadline'] = date_str
             # Try parsing various formats
-            for fmt in ['%d.%b.%Y', '%d-%b-%Y', '%Y-%m-%d', '%d/%m/%Y', '%d.%m.%Y']:
+            for fmt in DETAIL_DATE_FORMATS:
                 try:
                     result['deadline_date'] = datetime.strptime(date_str, fmt)
                     break
@@ -177,29 +211,20 @@ def find_deadline(element) -> tuple:
 
 def parse_deadline_text(text: str) -> tuple:
     """Parse deadline from text, return (string, datetime)"""
-    # Common patterns: "Deadline: 2024-03-15", "Apply by March 15, 2024"
-    patterns = [
-        r'[Dd]eadline[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'[Dd]eadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
-        r'[Aa]pply by[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})',
-        r'[Ll]ast application date[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'(\d{4}-\d{2}-\d{2})'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    patterns = DEADLINE_PATTERNS
+    if not any(marker in text for marker in DEADLINE_MARKERS):
+        # Only the bare ISO date fallback can match
+        patterns = DEADLINE_PATTERNS[-1:]
+
+    for pattern, formats in patterns:
+        match = pattern.search(text)
         if match:
             date_str = match.group(1)
-            try:
-                # Try different date formats
-                for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%B %d, %Y', '%B %d %Y']:
-                    try:
-                        deadline_date = datetime.strptime(date_str, fmt)
-                        return date_str, deadline_date
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
+            for fmt in formats:
+                try:
+                    return date_str, datetime.strptime(date_str, fmt)
+                except ValueError:
+                    continue
             return date_str, None
 
     return None, None
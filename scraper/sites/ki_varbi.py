@@ -1,16 +1,46 @@
 """Scraper for KI Staff positions (ki.varbi.com)"""
 
+import functools
 import logging
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
 from typing import List, Dict, Optional
 from datetime import datetime
 import re
 
+from scraper.http import SESSION
+
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://ki.varbi.com/en/"
 
+# Compiled at import: find_deadline parses text for up to 5 ancestors per link
+JOB_ID_RE = re.compile(r'jobID[=:](\d+)')
+
+# Evaluated by libxml2; extract_job_id drops anything that isn't jobID:NNN
+JOB_LINKS = etree.XPath("//a[contains(@href, 'jobID')]")
+# Text nodes of a subtree minus script/style bodies, as BeautifulSoup's
+# get_text() returns them
+TEXT_NODES = etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+
+ISO_FORMATS = ('%Y-%m-%d',)
+NUMERIC_FORMATS = ('%d/%m/%Y', '%m/%d/%Y')
+MONTH_NAME_FORMATS = ('%B %d, %Y', '%B %d %Y')
+
+# Tried in order; each pattern carries the strptime formats its match can take
+DEADLINE_PATTERNS = [(re.compile(p), formats) for p, formats in (
+    (r'[Dd]eadline[:\s]+(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+    (r'[Dd]eadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})', NUMERIC_FORMATS),
+    (r'[Aa]pply by[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})', MONTH_NAME_FORMATS),
+    (r'[Ll]ast application date[:\s]+(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+    (r'[Ss]ista ansökningsdag[:\s]+(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+    (r'(\d{4}-\d{2}-\d{2})', ISO_FORMATS),
+)]
+
+# Substrings every labelled pattern needs (the first letter is matched in
+# either case, so it is left out); text without one skips those regexes
+DEADLINE_MARKERS = ('eadline', 'pply by', 'ast application date', 'ista ansökningsdag')
+
 
 def scrape() -> List[Dict]:
     """
@@ -27,20 +57,24 @@ def scrape() -> List[Dict]:
     - description: brief description if available
     """
     jobs = []
+    parse_deadline_text.cache_clear()
 
     try:
         logger.info(f"Fetching {BASE_URL}")
-        response = requests.get(BASE_URL, timeout=30, headers={
-            'User-Agent': 'Mozilla/5.0 (compatible; KI-Job-Scraper/1.0)'
-        })
-        response.raise_for_status()
+        with SESSION.get(BASE_URL, timeout=30, stream=True) as response:
+            response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'lxml')
+            # Feed the page to libxml2 as it downloads instead of buffering it
+            parser = html.HTMLParser(encoding=declared_encoding(response))
+            for chunk in response.iter_content(chunk_size=16384):
+                parser.feed(chunk)
+            tree = parser.close()
 
         # Find all job links - Varbi uses /what:job/jobID:XXXXX/ format
-        job_links = soup.find_all('a', href=re.compile(r'jobID[=:]\d+'))
+        job_links = JOB_LINKS(tree)
 
         seen_ids = set()
+        deadline_cache = {}
 
         for link in job_links:
             href = link.get('href', '')
@@ -51,12 +85,12 @@ def scrape() -> List[Dict]:
 
             seen_ids.add(job_id)
 
-            title = link.get_text(strip=True)
+            title = element_text(link, strip=True)
             if not title or len(title) < 5:
                 # Try to get title from parent
-                parent = link.parent
-                if parent:
-                    title = parent.get_text(strip=True)
+                parent = link.getparent()
+                if parent is not None:
+                    title = element_text(parent, strip=True)
                 if not title or len(title) < 5:
                     continue
 
@@ -69,7 +103,7 @@ def scrape() -> List[Dict]:
                 url = href
 
             # Try to find deadline in surrounding elements
-            deadline, deadline_date = find_deadline(link)
+            deadline, deadline_date = find_deadline(link, deadline_cache)
 
             jobs.append({
                 'id': f"ki_varbi_{job_id}",
@@ -93,57 +127,78 @@ def scrape() -> List[Dict]:
         return []
 
 
+def declared_encoding(response) -> str:
+    """Charset from the Content-Type header, or UTF-8 when it names none
+
+    libxml2 only looks at the bytes (BOM, <meta charset>), so without this
+    a UTF-8 page that doesn't declare itself would be read as Latin-1.
+    """
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return 'utf-8'
+
+
 def extract_job_id(href: str) -> Optional[str]:
     """Extract job ID from Varbi URL"""
-    match = re.search(r'jobID[=:](\d+)', href)
+    match = JOB_ID_RE.search(href)
     if match:
         return match.group(1)
     return None
 
 
-def find_deadline(element) -> tuple:
-    """Try to find deadline date near an element"""
+def element_text(element, strip: bool = False) -> str:
+    """Text of an element, matching BeautifulSoup's get_text(strip=strip)"""
+    texts = TEXT_NODES(element)
+    if strip:
+        return ''.join(text.strip() for text in texts)
+    return ''.join(texts)
+
+
+def find_deadline(element, cache: Optional[Dict] = None) -> tuple:
+    """Try to find deadline date near an element
+
+    Links on the same listing share ancestors, so pass a dict as `cache`
+    to parse each ancestor's text only once per page.
+    """
+    if cache is None:
+        cache = {}
     deadline = None
     deadline_date = None
 
     # Check siblings and parent
-    parent = element.parent
+    parent = element.getparent()
     for _ in range(5):
         if parent is None:
             break
-        text = parent.get_text()
-        deadline, deadline_date = parse_deadline_text(text)
+        # Keyed on the element itself: lxml only keeps a proxy's id() stable
+        # while something references it
+        if parent not in cache:
+            cache[parent] = parse_deadline_text(element_text(parent))
+        deadline, deadline_date = cache[parent]
         if deadline:
             break
-        parent = parent.parent
+        parent = parent.getparent()
 
     return deadline, deadline_date
 
 
+@functools.lru_cache(maxsize=2048)
 def parse_deadline_text(text: str) -> tuple:
     """Parse deadline from text, return (string, datetime)"""
-    patterns = [
-        r'[Dd]eadline[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'[Dd]eadline[:\s]+(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
-        r'[Aa]pply by[:\s]+([A-Z][a-z]+ \d{1,2},? \d{4})',
-        r'[Ll]ast application date[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'[Ss]ista ansökningsdag[:\s]+(\d{4}-\d{2}-\d{2})',
-        r'(\d{4}-\d{2}-\d{2})'
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    patterns = DEADLINE_PATTERNS
+    if not any(marker in text for marker in DEADLINE_MARKERS):
+        # Only the bare ISO date fallback can match
+        patterns = DEADLINE_PATTERNS[-1:]
+
+    for pattern, formats in patterns:
+        match = pattern.search(text)
         if match:
             date_str = match.group(1)
-            try:
-                for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%B %d, %Y', '%B %d %Y']:
-                    try:
-                        deadline_date = datetime.strptime(date_str, fmt)
-                        return date_str, deadline_date
-                    except ValueError:
-                        continue
-            except Exception:
-                pass
+            for fmt in formats:
+                try:
+                    return date_str, datetime.strptime(date_str, fmt)
+                except ValueError:
+                    continue
             return date_str, None
 
     return None, None